@@ -1,9 +1,16 @@
 # pylint: disable=C0115,C0116
 
 from abc import ABC, abstractmethod
+from typing import List
 
 
 class Handler(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def write(self, message: str) -> None:
         raise NotImplementedError
+
+    def write_many(self, messages: List[str]) -> None:
+        for message in messages:
+            self.write(message)
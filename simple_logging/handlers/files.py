@@ -1,29 +1,117 @@
-from codecs import StreamReaderWriter, open
+import atexit
+import codecs
+import os
 from pathlib import Path
-from typing import Union
+from threading import Event, Lock, Thread
+from typing import IO, List, Optional, Union
 
 from .abc import Handler
 
+_raw_mode_flags = {
+    "w": os.O_CREAT | os.O_TRUNC,
+    "a": os.O_CREAT | os.O_APPEND,
+    "x": os.O_CREAT | os.O_EXCL,
+    "r": 0,
+}
 
-class FileHandler(Handler):
+
+def _raw_flags(mode: str) -> int:
+    """
+    Translates a file mode string into os.open flags for raw mode. Only the
+    creation characters and "+" are meaningful; raw mode always writes bytes, so
+    "b" and "t" are rejected, as is a read-only "r" mode.
+    """
+    kinds = [char for char in mode if char in _raw_mode_flags]
+    if len(kinds) != 1 or set(mode) - set("wax+r") or len(mode) != len(set(mode)):
+        raise ValueError(f"invalid mode for raw_mode: {mode!r}")
+    if kinds[0] == "r" and "+" not in mode:
+        raise ValueError(f"invalid mode for raw_mode: {mode!r}")
+    access = os.O_RDWR if "+" in mode else os.O_WRONLY
+    return access | _raw_mode_flags[kinds[0]]
+
+
+class FileHandler(Handler):  # pylint: disable=R0902
     """
-    The file handler writes output messages to a file.
+    The file handler writes output messages to a file. Writes are buffered and the
+    buffer is flushed to the file periodically, when it fills up and at exit.
 
     Args:
         - path (str or pathlib.Path): the file path
         - mode (str): the file handler's mode (defaults to "a" for append)
         - encodeing (str): the file's encoding (defaults to "utf-8")
+        - buffer_size (int): the size in bytes of the write buffer (defaults to 65536)
+        - flush_interval (float): the number of seconds between periodic flushes of
+            the write buffer; 0 disables periodic flushing (defaults to 1.0)
+        - raw_mode (bool): should messages be encoded into a byte buffer that is
+            written straight to the file descriptor, bypassing the text and buffered
+            io layers? (defaults to False)
     """
 
+    __slots__ = (
+        "path",
+        "mode",
+        "encoding",
+        "buffer_size",
+        "flush_interval",
+        "raw_mode",
+        "fh",
+        "_fd",
+        "_buffer",
+        "_lock",
+        "_encoder",
+        "_closed",
+        "_flusher",
+    )
+
     def __init__(
-        self, path: Union[str, Path], mode: str = "a", encoding: str = "utf-8"
+        self,
+        path: Union[str, Path],
+        mode: str = "a",
+        encoding: str = "utf-8",
+        buffer_size: int = 65536,
+        flush_interval: float = 1.0,
+        raw_mode: bool = False,
     ) -> None:
         if isinstance(path, Path):
             path = str(path.resolve())
         self.path: str = path
         self.mode: str = mode
         self.encoding: str = encoding
-        self.fh: StreamReaderWriter = open(self.path, self.mode, self.encoding)
+        self.buffer_size: int = buffer_size
+        self.flush_interval: float = flush_interval
+        self.raw_mode: bool = raw_mode
+
+        self.fh: Optional[IO[str]] = None
+        self._fd: Optional[int] = None
+        if self.raw_mode:
+            self._fd = os.open(self.path, _raw_flags(self.mode), 0o644)
+            self._buffer = bytearray()
+            self._lock = Lock()
+            # one incremental encoder for the whole file, so codecs that start with a
+            # byte order mark only write it once -- and not at all when appending to
+            # a file that already has content, matching TextIOWrapper
+            self._encoder = codecs.getincrementalencoder(self.encoding)()
+            if "a" in self.mode and os.fstat(self._fd).st_size > 0:
+                self._encoder.setstate(0)
+        else:
+            self.fh = open(
+                self.path,
+                self.mode,
+                encoding=self.encoding,
+                newline="",
+                buffering=self.buffer_size,
+            )
+        atexit.register(self.close)
+
+        self._closed = Event()
+        self._flusher: Optional[Thread] = None
+        if self.flush_interval > 0:
+            self._flusher = Thread(
+                target=self._flush_periodically,
+                name=f"simple_logging-flush-{self.path}",
+                daemon=True,
+            )
+            self._flusher.start()
 
     def write(self, message: str) -> None:
         """
@@ -32,4 +120,73 @@ class FileHandler(Handler):
         Args:
             - message (str): the message to be written to the file
         """
-        self.fh.write(message)
+        if self.raw_mode:
+            self._write_raw(message)
+        else:
+            assert self.fh is not None
+            self.fh.write(message)
+
+    def write_many(self, messages: List[str]) -> None:
+        """
+        Writes a batch of messages to the configured file in a single call.
+
+        Args:
+            - messages (List[str]): the messages to be written to the file
+        """
+        if self.raw_mode:
+            self._write_raw("".join(messages))
+        else:
+            assert self.fh is not None
+            self.fh.writelines(messages)
+
+    def flush(self) -> None:
+        """
+        Flushes the write buffer to the file.
+        """
+        if self.raw_mode:
+            with self._lock:
+                self._flush_raw()
+        else:
+            assert self.fh is not None
+            self.fh.flush()
+
+    def close(self) -> None:
+        """
+        Flushes the write buffer and closes the file.
+        """
+        self._closed.set()
+        atexit.unregister(self.close)
+        if self.raw_mode:
+            with self._lock:
+                if self._fd is None:
+                    return
+                self._flush_raw()
+                os.close(self._fd)
+                self._fd = None
+        else:
+            assert self.fh is not None
+            self.fh.close()
+
+    def _write_raw(self, message: str) -> None:
+        with self._lock:
+            if self._fd is None:
+                raise ValueError("I/O operation on closed file.")
+            self._buffer += self._encoder.encode(message)
+            if len(self._buffer) >= self.buffer_size:
+                self._flush_raw()
+
+    def _flush_raw(self) -> None:
+        if self._fd is None:
+            raise ValueError("I/O operation on closed file.")
+        written = 0
+        with memoryview(self._buffer) as view:
+            while written < len(view):
+                written += os.write(self._fd, view[written:])
+        self._buffer.clear()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+            except ValueError:  # the file has been closed
+                return
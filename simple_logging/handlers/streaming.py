@@ -1,5 +1,6 @@
 from io import TextIOWrapper
 from sys import stderr, stdout
+from typing import List
 
 from .abc import Handler
 
@@ -14,6 +15,8 @@ class StreamingHandler(Handler):
         - stream (TextIOWrapper): the output stream that writes the messages
     """
 
+    __slots__ = ("stream",)
+
     def __init__(self, stream: TextIOWrapper) -> None:
         self.stream: TextIOWrapper = stream
 
@@ -26,12 +29,23 @@ class StreamingHandler(Handler):
         """
         self.stream.write(message)
 
+    def write_many(self, messages: List[str]) -> None:
+        """
+        Writes a batch of messages to the configured stream in a single call.
+
+        Args:
+            - messages (List[str]): the messages to be written to the stream
+        """
+        self.stream.writelines(messages)
+
 
 class StdOutHandler(StreamingHandler):  # coverage: disable
     """
     A convenience class that uses STDOUT as the output stream.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(stream=stdout)
 
@@ -41,5 +55,7 @@ class StdErrHandler(StreamingHandler):  # coverage: disable
     A convenience class that uses STDERR as the output stream.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(stream=stderr)
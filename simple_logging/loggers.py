@@ -1,14 +1,110 @@
+import atexit
 import re
-from datetime import datetime
 from enum import IntEnum
-from traceback import format_exc
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from queue import Empty, Queue
+from string import Formatter
+from threading import Thread
+from time import localtime, strftime, time
+from traceback import format_exc, print_exc
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
 from .handlers.abc import Handler
 from .handlers.streaming import StdOutHandler
 
 keyname_regex = re.compile(r"(?:\{([a-zA-Z0-9_]+)\})")
 
+# marks attributes that haven't been assigned yet while __init__ is running
+_unset = object()
+
+_timestamp_prefix = (-1, "")
+
+
+def _now_iso() -> str:
+    """
+    Returns the current local time as an ISO 8601 string with microseconds, e.g.
+    2020-09-29T12:39:06.125796. The date and time part is only formatted once per
+    second.
+    """
+    global _timestamp_prefix  # pylint: disable=W0603
+
+    now = time()
+    seconds = int(now)
+    cached_seconds, prefix = _timestamp_prefix
+    if seconds != cached_seconds:
+        prefix = strftime("%Y-%m-%dT%H:%M:%S", localtime(seconds))
+        _timestamp_prefix = (seconds, prefix)
+    return f"{prefix}.{int((now - seconds) * 1_000_000):06d}"
+
+
+@lru_cache(maxsize=128)
+def _compile_template(
+    template: str, ensure_new_lines: bool
+) -> Callable[[Dict[str, Any]], str]:
+    """
+    Compiles a template into a function that renders it from a dict of values.
+
+    The template is parsed once and generated as source for a function returning a
+    single f-string, so rendering a message does not have to reparse the template
+    the way str.format does. When ensure_new_lines is set the new line is appended
+    by the compiled function, and only checked at runtime if the template ends with
+    a key. Templates using anything beyond plain {key} fields (format specs,
+    conversions, indexing, positional fields) fall back to str.format.
+
+    Compiled functions are cached, so loggers sharing a template share them.
+
+    Args:
+        - template (str): the output template
+        - ensure_new_lines (bool): should the output end with a new line?
+
+    Returns:
+        Callable[[Dict[str, Any]], str]: the compiled formatting function
+    """
+
+    def fallback(kwargs: Dict[str, Any]) -> str:
+        output = template.format_map(kwargs)
+        if ensure_new_lines and not output.endswith("\n"):
+            output += "\n"
+        return output
+
+    try:
+        parsed = list(Formatter().parse(template))
+    except ValueError:
+        return fallback
+
+    body = ""
+    keys: List[str] = []
+    ends_with_key = True
+    for literal, field, spec, conversion in parsed:
+        if literal:
+            body += literal.replace("{", "{{").replace("}", "}}")
+            ends_with_key = False
+        if field is None:
+            continue
+        if not field.isidentifier() or spec or conversion:
+            return fallback
+        # keys are bound as argument defaults so they are loaded as fast locals
+        body += f"{{kwargs[_key{len(keys)}]}}"
+        keys.append(field)
+        ends_with_key = True
+
+    if ensure_new_lines and not ends_with_key and not body.endswith("\n"):
+        body += "\n"
+    result = f"f{body!r}"
+    if ensure_new_lines and ends_with_key:
+        result = f"_ensure_new_line({result})"
+
+    params = "".join(f", _key{index}={key!r}" for index, key in enumerate(keys))
+    source = f"def _format(kwargs{params}):\n    return {result}\n"
+    namespace: Dict[str, Any] = {"_ensure_new_line": _ensure_new_line}
+    exec(compile(source, "<template>", "exec"), namespace)  # pylint: disable=W0122
+    return namespace["_format"]
+
+
+def _ensure_new_line(output: str) -> str:
+    return output if output.endswith("\n") else output + "\n"
+
 
 class LogLevel(IntEnum):  # pylint: disable=C0115
     DEBUG = 0
@@ -17,7 +113,15 @@ class LogLevel(IntEnum):  # pylint: disable=C0115
     ERROR = 3
 
 
-class Logger:
+_level_names = {level: level.name for level in LogLevel}
+
+# the keys of Logger._default_template, so loggers using it skip the regex. the fill
+# dict is only ever copied from, so loggers can share it
+_default_keys = frozenset(("timestamp", "level", "name", "message"))
+_default_fill = dict.fromkeys(_default_keys, "\b")
+
+
+class Logger:  # pylint: disable=R0902
     """
     A logger is the main interface to dumping information outputs. Loggers configure
     output templates and output handlers.
@@ -33,11 +137,19 @@ class Logger:
         - handlers (List[Handler]): a list of handlers this logger uses (default [])
         - ensure_new_lines (bool): should all outputs end with a new line?
             (defaults to True)
+        - async_write (bool): should outputs be handed to a background thread that
+            writes them to the handlers, keeping handler I/O out of the calling
+            thread? call close() to stop the thread (defaults to False)
+        - queue_size (int): the maximum number of outputs waiting to be written
+            when async_write is enabled; logging blocks once it is reached
+            (defaults to 8192)
 
     Kwargs:
         Any keyword argument passed to the constructor will be used as a default
         value when formatting the template during a write. These values can be
         overwritten using the **overrides kwargs options in the logging methods.
+        They are kept in the read-only `defaults` mapping; to change them after
+        construction, assign a new dict to `defaults`.
 
     Examples:
         >>> from simple_logging import Logger
@@ -71,9 +183,31 @@ class Logger:
         ZeroDivisionError: division by zero
     """
 
+    __slots__ = (
+        "name",
+        "level",
+        "template",
+        "ensure_new_lines",
+        "handlers",
+        "defaults",
+        "keys",
+        "_defaults_fill",
+        "_const_defaults",
+        "_callable_defaults",
+        "_format",
+        "_fast",
+        "_debug_on",
+        "_info_on",
+        "_warning_on",
+        "_error_on",
+        "_queue",
+        "_writer",
+    )
+
     _default_level = LogLevel.INFO
     _default_template = "{timestamp} {level} {name}: {message}"
     _default_handler = StdOutHandler()
+    _batch_size = 256
 
     def __init__(
         self,
@@ -83,6 +217,8 @@ class Logger:
         handler: Optional[Handler] = None,
         handlers: Optional[List[Handler]] = None,
         ensure_new_lines: bool = True,
+        async_write: bool = False,
+        queue_size: int = 8192,
         **defaults,
     ) -> None:
         self.name: str = name
@@ -96,14 +232,60 @@ class Logger:
         if not self.handlers:
             self.handlers = [self._default_handler]
 
-        self.defaults: Dict[str, Any] = defaults
-
-        self.keys = re.findall(keyname_regex, self.template)
+        self.defaults: Mapping[str, Any] = defaults
+
+        self._queue: Optional[Queue] = None
+        self._writer: Optional[Thread] = None
+        if async_write:
+            self._queue = Queue(maxsize=queue_size)
+            self._writer = Thread(
+                target=self._write_queued,
+                args=(self._queue,),
+                name=f"simple_logging-{name}",
+                daemon=True,
+            )
+            self._writer.start()
+            atexit.register(self.close)
 
     def __setattr__(self, name: str, value: Any) -> None:
+        # the attributes derived from level, template, defaults and ensure_new_lines
+        # are (re)computed here whenever those are assigned, including from __init__
+        # pylint: disable=W0201
+        if name == "defaults":
+            # constant and callable defaults are split on assignment, so mutating
+            # them in place would be silently ignored -- make that fail instead
+            value = MappingProxyType(dict(value))
         super().__setattr__(name, value)
-        if name == "template":
-            self.keys = re.findall(keyname_regex, self.template)
+        if name == "level":
+            self._debug_on = value <= LogLevel.DEBUG
+            self._info_on = value <= LogLevel.INFO
+            self._warning_on = value <= LogLevel.WARNING
+            self._error_on = value <= LogLevel.ERROR
+        elif name == "defaults":
+            self._const_defaults = {}
+            self._callable_defaults = {}
+            for key, default in value.items():
+                if callable(default):
+                    self._callable_defaults[key] = default
+                else:
+                    self._const_defaults[key] = default
+        elif name == "template":
+            if value == self._default_template:
+                self.keys = _default_keys
+                self._defaults_fill = _default_fill
+            else:
+                self.keys = frozenset(re.findall(keyname_regex, value))
+                self._defaults_fill = dict.fromkeys(self.keys, "\b")
+        if name in ("template", "ensure_new_lines"):
+            template = getattr(self, "template", _unset)
+            ensure_new_lines = getattr(self, "ensure_new_lines", _unset)
+            if template is _unset or ensure_new_lines is _unset:
+                return
+            ensure_new_lines = bool(ensure_new_lines)
+            self._format = _compile_template(template, ensure_new_lines)
+            # defaults can't change the output of the default template, so only the
+            # template and new line handling decide whether _log_fast can be used
+            self._fast = template == self._default_template and ensure_new_lines
 
     def debug(self, message: str, **overrides) -> None:
         """
@@ -116,7 +298,12 @@ class Logger:
             Any keyword arguments passed to this method will either set or override
             the values used to format the output template.
         """
-        self._log(LogLevel.DEBUG, message, **overrides)
+        if not self._debug_on:
+            return
+        if self._fast and not overrides:
+            self._log_fast(LogLevel.DEBUG, message)
+        else:
+            self._log(LogLevel.DEBUG, message, overrides)
 
     def info(self, message: str, **overrides) -> None:
         """
@@ -129,7 +316,12 @@ class Logger:
             Any keyword arguments passed to this method will either set or override
             the values used to format the output template.
         """
-        self._log(LogLevel.INFO, message, **overrides)
+        if not self._info_on:
+            return
+        if self._fast and not overrides:
+            self._log_fast(LogLevel.INFO, message)
+        else:
+            self._log(LogLevel.INFO, message, overrides)
 
     def warning(self, message: str, **overrides) -> None:
         """
@@ -142,7 +334,12 @@ class Logger:
             Any keyword arguments passed to this method will either set or override
             the values used to format the output template.
         """
-        self._log(LogLevel.WARNING, message, **overrides)
+        if not self._warning_on:
+            return
+        if self._fast and not overrides:
+            self._log_fast(LogLevel.WARNING, message)
+        else:
+            self._log(LogLevel.WARNING, message, overrides)
 
     def error(self, message: str, **overrides) -> None:
         """
@@ -155,7 +352,12 @@ class Logger:
             Any keyword arguments passed to this method will either set or override
             the values used to format the output template.
         """
-        self._log(LogLevel.ERROR, message, **overrides)
+        if not self._error_on:
+            return
+        if self._fast and not overrides:
+            self._log_fast(LogLevel.ERROR, message)
+        else:
+            self._log(LogLevel.ERROR, message, overrides)
 
     def exception(self, message: str, **overrides) -> None:
         """
@@ -168,42 +370,98 @@ class Logger:
             Any keyword arguments passed to this method will either set or override
             the values used to format the output template.
         """
+        if not self._error_on:
+            return
+        # only format the traceback once we know the message will be output
         message = f"{message}\n{format_exc()}"
-        self._log(LogLevel.ERROR, message, **overrides)
+        self._log(LogLevel.ERROR, message, overrides)
 
-    def _log(self, level: LogLevel, message: str, **overrides) -> None:
-        if level < self.level:
-            return
+    def flush(self) -> None:
+        """
+        Blocks until every output queued by an async_write logger has been written
+        to the handlers. Does nothing for synchronous loggers.
+        """
+        queue = self._queue
+        if queue is not None:
+            queue.join()
 
-        kwargs = {
-            key: value() if callable(value) else value
-            for key, value in self.defaults.items()
-        }
+    def close(self) -> None:
+        """
+        Writes every output still queued by an async_write logger and stops its
+        writer thread. Later messages are written synchronously. Does nothing for
+        synchronous loggers; the handlers are left open either way.
+        """
+        queue, self._queue = self._queue, None
+        if queue is None:
+            return
+        atexit.unregister(self.close)
+        queue.put(None)
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+
+    def _log(self, level: LogLevel, message: str, overrides: Dict[str, Any]) -> None:
+        kwargs = self._defaults_fill.copy()
+        kwargs.update(self._const_defaults)
+        for key, default in self._callable_defaults.items():
+            kwargs[key] = default()
 
         kwargs["message"] = message
 
         timestamp = overrides.pop("timestamp", None)
-        kwargs["timestamp"] = timestamp or datetime.now().isoformat()
+        kwargs["timestamp"] = timestamp or _now_iso()
 
         _level = overrides.pop("level", None)
-        kwargs["level"] = _level or level.name
+        kwargs["level"] = _level or _level_names[level]
 
         name = overrides.pop("name", None)
         kwargs["name"] = name or self.name
 
-        kwargs.update(
-            **{
-                key: value() if callable(value) else value
-                for key, value in overrides.items()
-            }
-        )
-
-        for key in self.keys:
-            if key not in kwargs:
-                kwargs[key] = "\b"
-
-        for handler in self.handlers:
-            output = self.template.format(**kwargs)
-            if self.ensure_new_lines and not output.endswith("\n"):
-                output += "\n"
+        for key, value in overrides.items():
+            kwargs[key] = value() if callable(value) else value
+
+        self._write(self._format(kwargs))
+
+    def _log_fast(self, level: LogLevel, message: str) -> None:
+        # the default template with no overrides: skip building the kwargs dict
+        output = f"{_now_iso()} {_level_names[level]} {self.name}: {message}"
+        self._write(_ensure_new_line(output))
+
+    def _write(self, output: str) -> None:
+        queue = self._queue
+        if queue is not None:
+            queue.put(output)
+            return
+
+        handlers = self.handlers
+        if len(handlers) == 1:
+            # the common case -- skip setting up the loop
+            handlers[0].write(output)
+            return
+
+        for handler in handlers:
             handler.write(output)
+
+    def _write_queued(self, queue: Queue) -> None:
+        stopping = False
+        while not stopping:
+            # block for one output, then take whatever else is already queued so
+            # the handlers can write the batch in one go
+            batch = [queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except Empty:
+                    break
+            # close() queues None to stop the thread once everything before it has
+            # been written
+            stopping = None in batch
+            outputs = [output for output in batch if output is not None]
+            try:
+                for handler in self.handlers:
+                    handler.write_many(outputs)
+            except Exception:  # pylint: disable=W0703
+                print_exc()
+            finally:
+                for _ in batch:
+                    queue.task_done()
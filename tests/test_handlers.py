@@ -0,0 +1,124 @@
+import time
+
+import pytest
+
+from simple_logging import FileHandler, Logger
+
+
+def describe_file_handler():
+    def writes_are_buffered_until_flushed(tmp_path):  # pylint: disable=W0612
+        path = tmp_path / "test.log"
+        handler = FileHandler(path, flush_interval=0)
+        logger = Logger("test", handler=handler, template="{message}")
+        logger.info("buffered")
+
+        assert path.read_text() == ""
+
+        handler.flush()
+        assert path.read_text() == "buffered\n"
+
+        handler.close()
+
+    def close_flushes_buffer(tmp_path):  # pylint: disable=W0612
+        path = tmp_path / "test.log"
+        handler = FileHandler(path, flush_interval=0)
+        handler.write("first\n")
+        handler.close()
+
+        handler = FileHandler(path, flush_interval=0)
+        handler.write("second\n")
+        handler.close()
+
+        assert path.read_text() == "first\nsecond\n"
+
+    def flushes_periodically(tmp_path):  # pylint: disable=W0612
+        path = tmp_path / "test.log"
+        handler = FileHandler(path, flush_interval=0.01)
+        handler.write("periodic\n")
+
+        for _ in range(100):
+            if path.read_text():
+                break
+            time.sleep(0.01)
+
+        assert path.read_text() == "periodic\n"
+        handler.close()
+
+    def close_stops_periodic_flushing(tmp_path):  # pylint: disable=W0612
+        handler = FileHandler(tmp_path / "test.log", flush_interval=0.01)
+        flusher = handler._flusher  # pylint: disable=W0212
+        assert flusher is not None and flusher.is_alive()
+
+        handler.close()
+        flusher.join(1)
+
+        assert not flusher.is_alive()
+
+    def write_many_writes_batch_in_order(tmp_path):  # pylint: disable=W0612
+        path = tmp_path / "test.log"
+        handler = FileHandler(path, flush_interval=0)
+        handler.write_many(["one\n", "two\n", "three\n"])
+        handler.close()
+
+        assert path.read_text() == "one\ntwo\nthree\n"
+
+    def raw_mode_buffers_and_flushes(tmp_path):  # pylint: disable=W0612
+        path = tmp_path / "test.log"
+        path.write_text("existing\n")
+        handler = FileHandler(path, flush_interval=0, raw_mode=True, buffer_size=16)
+        handler.write("short\n")
+
+        assert path.read_text() == "existing\n"
+
+        handler.write_many(["filled the ", "buffer\n"])
+        assert path.read_text() == "existing\nshort\nfilled the buffer\n"
+
+        handler.write("tail\n")
+        handler.close()
+        handler.close()
+
+        assert path.read_text() == "existing\nshort\nfilled the buffer\ntail\n"
+
+    def raw_mode_respects_file_mode(tmp_path):  # pylint: disable=W0612
+        path = tmp_path / "test.log"
+        path.write_text("existing\n")
+
+        handler = FileHandler(path, mode="r+", flush_interval=0, raw_mode=True)
+        handler.write("EX")
+        handler.close()
+        assert path.read_text() == "EXisting\n"
+
+        with pytest.raises(FileExistsError):
+            FileHandler(path, mode="x", flush_interval=0, raw_mode=True)
+
+        handler = FileHandler(path, mode="w", flush_interval=0, raw_mode=True)
+        handler.write("new\n")
+        handler.close()
+        assert path.read_text() == "new\n"
+
+    def raw_mode_rejects_unsupported_modes(tmp_path):  # pylint: disable=W0612
+        for mode in ("r", "ab", "rw", "aa"):
+            with pytest.raises(ValueError):
+                FileHandler(tmp_path / "test.log", mode=mode, raw_mode=True)
+
+    def raw_mode_writes_one_byte_order_mark(tmp_path):  # pylint: disable=W0612
+        path = tmp_path / "test.log"
+        handler = FileHandler(path, encoding="utf-16", flush_interval=0, raw_mode=True)
+        handler.write("ab\n")
+        handler.write_many(["cd\n", "ef\n"])
+        handler.close()
+
+        handler = FileHandler(path, encoding="utf-16", flush_interval=0, raw_mode=True)
+        handler.write("gh\n")
+        handler.close()
+
+        assert path.read_text(encoding="utf-16") == "ab\ncd\nef\ngh\n"
+
+    def raw_mode_write_after_close(tmp_path):  # pylint: disable=W0612
+        handler = FileHandler(tmp_path / "test.log", flush_interval=0, raw_mode=True)
+        handler.close()
+
+        with pytest.raises(ValueError):
+            handler.write("too late\n")
+        with pytest.raises(ValueError):
+            handler.write_many(["too late\n"])
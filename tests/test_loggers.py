@@ -1,6 +1,8 @@
 import re
 from io import StringIO
 
+import pytest
+
 from simple_logging import Logger, LogLevel, StreamingHandler
 
 handler = StreamingHandler(stream=StringIO())
@@ -32,6 +34,47 @@ def describe_level_setting():
             output,
         )
 
+    def default_template_with_defaults():  # pylint: disable=W0612
+        logger = Logger("test", handler=handler, foo="bar")
+        logger.warning("this should print")
+
+        output = get_output()
+        assert re.match(
+            r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6} WARNING test: this should print\n",
+            output,
+        )
+
+        logger.warning("overridden", name="other")
+
+        output = get_output()
+        assert output.endswith(" WARNING other: overridden\n")
+
+    def message_ending_in_new_line():  # pylint: disable=W0612
+        logger = Logger("test", handler=handler)
+        logger.info("fast path\n")
+        logger.info("slow path\n", foo="bar")
+
+        output = get_output()
+        lines = output.split("\n")
+        assert len(lines) == 3
+        assert lines[0].endswith(" INFO test: fast path")
+        assert lines[1].endswith(" INFO test: slow path")
+        assert lines[2] == ""
+
+    def level_changed_after_init():  # pylint: disable=W0612
+        logger = Logger("test", level=LogLevel.INFO, handler=handler)
+        logger.level = LogLevel.ERROR
+        logger.warning("this shouldn't print")
+
+        output = get_output()
+        assert output == ""
+
+        logger.level = LogLevel.DEBUG
+        logger.debug("this should print")
+
+        output = get_output()
+        assert output.endswith("DEBUG test: this should print\n")
+
 
 def describe_non_standard_template_keys():
     def test_default_provided():  # pylint: disable=W0612
@@ -55,6 +98,43 @@ def describe_non_standard_template_keys():
         output = get_output()
         assert output == "\b: not provided\n"
 
+    def test_default_is_callable():  # pylint: disable=W0612
+        counter = iter(range(10))
+        logger = Logger(
+            "test",
+            handler=handler,
+            template="{foo}: {message}",
+            foo=lambda: next(counter),
+        )
+        logger.info("first")
+        logger.info("second")
+
+        output = get_output()
+        assert output == "0: first\n1: second\n"
+
+    def test_callable_value_logs():  # pylint: disable=W0612
+        logger = Logger("test", handler=handler, template="{foo}: {message}")
+
+        def func():
+            logger.info("inner", foo="baz")
+            return "bar"
+
+        logger.info("outer", foo=func)
+
+        output = get_output()
+        assert output == "baz: inner\nbar: outer\n"
+
+    def test_defaults_replaced():  # pylint: disable=W0612
+        logger = Logger("test", handler=handler, template="{foo}: {message}", foo="bar")
+        with pytest.raises(TypeError):
+            logger.defaults["foo"] = "baz"  # type: ignore
+
+        logger.defaults = {"foo": "baz"}
+        logger.info("ok")
+
+        output = get_output()
+        assert output == "baz: ok\n"
+
     def test_value_is_callable():  # pylint: disable=W0612
         logger = Logger("test", handler=handler, template="{foo}: {message}")
         func = lambda: "yay!"
@@ -64,6 +144,64 @@ def describe_non_standard_template_keys():
         output = get_output()
         assert output == "yay!: from lambda\n"
 
+    def test_template_with_format_spec():  # pylint: disable=W0612
+        logger = Logger("test", handler=handler, template="{foo:>5}|{{{message}}}")
+        logger.info("ok", foo="bar")
+
+        output = get_output()
+        assert output == "  bar|{ok}\n"
+
+    def test_template_changed_after_init():  # pylint: disable=W0612
+        logger = Logger("test", handler=handler, template="{foo}: {message}", foo="bar")
+        logger.template = "{message} ({foo})"
+        logger.info("ok")
+
+        output = get_output()
+        assert output == "ok (bar)\n"
+
+
+def test_falsy_ensure_new_lines():
+    logger = Logger("test", handler=handler, template="{message}", ensure_new_lines=None)
+    logger.info("no new line")
+
+    output = get_output()
+    assert output == "no new line"
+
+    logger = Logger("test", handler=handler, ensure_new_lines=None)
+    logger.info("default template")
+
+    output = get_output()
+    assert output.endswith(" INFO test: default template")
+
+
+def test_multiple_handlers():
+    other = StreamingHandler(stream=StringIO())
+    logger = Logger("test", handlers=[handler, other], template="{foo:>5}: {message}")
+    logger.info("ok", foo="bar")
+
+    output = get_output()
+    assert output == "  bar: ok\n"
+    assert other.stream.getvalue() == output
+
+
+def test_multiple_handlers_format_once():
+    other = StreamingHandler(stream=StringIO())
+    logger = Logger("test", handlers=[handler, other], template="{foo}: {message}")
+    calls = []
+    format = logger._format  # pylint: disable=W0212
+
+    def counting_format(kwargs):
+        calls.append(kwargs["message"])
+        return format(kwargs)
+
+    logger._format = counting_format  # pylint: disable=W0212
+    logger.info("ok", foo="bar")
+
+    output = get_output()
+    assert output == "bar: ok\n"
+    assert other.stream.getvalue() == output
+    assert calls == ["ok"]
+
 
 def test_exception_capturing():
     logger = Logger("test", handler=handler, template="{level} {name}: {message}")
@@ -78,3 +216,46 @@ def test_exception_capturing():
         r"ERROR test: caught\nTraceback \(most recent call last\):\n  File .+\n    1 / 0\nZeroDivisionError: division by zero",
         output,
     )
+
+
+def test_async_write():
+    logger = Logger("test", handler=handler, template="{message}", async_write=True)
+    for i in range(100):
+        logger.info(str(i))
+    logger.flush()
+
+    output = get_output()
+    assert output == "".join(f"{i}\n" for i in range(100))
+
+
+def test_async_close():
+    logger = Logger("test", handler=handler, template="{message}", async_write=True)
+    writer = logger._writer  # pylint: disable=W0212
+    assert writer is not None and writer.is_alive()
+
+    for i in range(100):
+        logger.info(str(i))
+    logger.close()
+
+    assert not writer.is_alive()
+    assert get_output() == "".join(f"{i}\n" for i in range(100))
+
+    logger.info("after close")
+    logger.close()
+    assert get_output() == "after close\n"
+
+
+def test_exception_below_logger_level(monkeypatch):
+    def fail():
+        raise AssertionError("the traceback shouldn't be formatted")
+
+    monkeypatch.setattr("simple_logging.loggers.format_exc", fail)
+    logger = Logger("test", level=LogLevel.ERROR + 1, handler=handler)
+
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logger.exception("caught")
+
+    output = get_output()
+    assert output == ""